@@ -21,12 +21,23 @@
 """
 import datetime
 import logging
+import multiprocessing
 import os
+import random
 import time
 import concurrent.futures
+import requests
 
 try:
-    from pymisp import MISPObject, MISPEvent, ExpandedPyMISP, MISPGalaxyCluster, MISPGalaxyClusterElement
+    from pymisp import (
+        MISPObject,
+        MISPEvent,
+        ExpandedPyMISP,
+        MISPGalaxyCluster,
+        MISPGalaxyClusterElement,
+        MISPServerError,
+        MISPTag
+        )
 except ImportError as no_pymisp:
     raise SystemExit(
         "The PyMISP package must be installed to use this program."
@@ -41,6 +52,7 @@ from .helper import (
     get_threat_actor_galaxy_id,
     get_actor_galaxy_map,
     add_cluster_elements,
+    normalize_killchain,
     normalize_locale,
     normalize_sector,
     get_region_galaxy_map,
@@ -48,6 +60,45 @@ from .helper import (
     taxonomic_event_tagging
     )
 
+
+# MISP attribute category for each (normalized) kill chain phase
+_KC_GOAL_CATEGORY = {
+    "installation": "Payload installation",
+    "weaponization": "Payload delivery",
+    "delivery": "Payload delivery",
+    "objectives": "External analysis",
+    "reconnaissance": "External analysis",
+    "command-control": "Network activity"
+}
+
+
+def _parse_actor_name(actor_name: str):
+    """Return the branch of an adversary name and the region (if any) that branch represents."""
+    actor_split = actor_name.split(" ")
+    actor_branch = actor_split[1] if len(actor_split) > 1 else actor_split[0]
+    branch_member = actor_branch.upper()
+    actor_region = Adversary[branch_member].value if branch_member in Adversary.__members__ else None
+    return actor_branch, actor_region
+
+
+# Per-process event construction context, populated once by the pool initializer
+_BUILD_CONTEXT = {}
+
+
+def _init_event_builder(importer, act_det: dict, already: dict):
+    """Store the importer, adversary details and a read-only copy of the imported events in a worker process."""
+    _BUILD_CONTEXT.update(importer=importer, act_det=act_det, already=already)
+
+
+def _build_event_in_worker(act):
+    """Build a single adversary event within a worker process, returning it in JSON form."""
+    event, stamp = _BUILD_CONTEXT["importer"].build_event_for_actor(act,
+                                                                   _BUILD_CONTEXT["act_det"],
+                                                                   _BUILD_CONTEXT["already"]
+                                                                   )
+    return (event.to_json() if event else None), stamp
+
+
 class ActorsImporter:
     """Tool used to import actors from the Crowdstrike Intel API and push them as events in MISP through the MISP API.
 
@@ -66,66 +117,117 @@ class ActorsImporter:
         self.import_settings = import_settings
         self.log: logging.Logger = logger
         self.regions = get_region_galaxy_map(misp_client)
+        self._ts_cache = 0
+        # Per-run constants, computed once rather than for every adversary event
+        self._actors_tags = tuple(settings["CrowdStrike"]["actors_tags"].split(","))
+        self._tax = {
+            k: confirm_boolean_param(settings["TAGGING"].get(k, False)) for k in (
+                "taxonomic_TYPE", "taxonomic_INFORMATION-SECURITY-DATA-SOURCE", "taxonomic_IEP",
+                "taxonomic_IEP2", "taxonomic_IEP2_VERSION", "taxonomic_TLP", "taxonomic_WORKFLOW"
+                )
+            }
+
+    def __getstate__(self):
+        """Leave the API clients behind when the importer is sent to event construction processes."""
+        state = self.__dict__.copy()
+        state.pop("misp", None)
+        state.pop("intel_api_client", None)
+        return state
 
     def adversary_galaxy_tag(self, actor: str):
         return self.import_settings["actor_map"][actor.upper()]["tag_name"]
 
 
-    def batch_import_actors(self, act, act_det, already):
-        def do_update(evt):
-            return self.misp.add_event(evt, True)
+    def build_event_for_actor(self, act, act_det: dict, already: dict):
+        """Prepare the MISP event for an adversary without submitting it.
 
+        The already imported map is only read here, the caller records newly built adversaries.
+        Returns the event (or None when skipped) and the adversary modification timestamp to checkpoint.
+        """
         actor_name = act.get('name')
-        act_detail = Adversary[actor_name.split(" ")[1].upper()].value
-        info_str = f"ADV-{act.get('id')} {actor_name} ({act_detail})"
-        returned = False
+        event = None
+        nowstamp = None
         if actor_name is not None:
+            parsed_name = _parse_actor_name(actor_name)
+            actor_branch, actor_region = parsed_name
+            region_label = f" ({actor_region})" if actor_region else ""
+            info_str = f"ADV-{act.get('id')} {actor_name}{region_label}"
             if already.get(info_str) is None:
-                event: MISPEvent = self.create_event_from_actor(act, act_det)
+                event: MISPEvent = self.create_event_from_actor(act, act_det, parsed_name)
                 self.log.debug("Created adversary event for %s", act.get('name'))
                 if event:
-                    for tag in self.settings["CrowdStrike"]["actors_tags"].split(","):
+                    for tag in self._actors_tags:
                         event.add_tag(tag)
                     # Create an actor specific tag
-                    actor_tag = actor_name.split(" ")[1]
-                    event.add_tag(f"crowdstrike:branch=\"{actor_tag}\"")
-                    if actor_name is not None:
-                        already[actor_name] = True
-                    success = False
-                    max_tries = 3
-                    for cur_try in range(max_tries):
-                        try:
-                            do_update(event)
-                            success = True
-                        except Exception as err:
-                            timeout = 0.3 * 2 ** cur_try
-                            self.log.warning("Could not add or tag event %s. Will retry in %s seconds.\n%s", event.info, timeout, str(err))
-                            time.sleep(timeout)
-                    if not success:
-                        self.log.warning("Unable to add event %s.", event.info)
+                    event.add_tag(f"crowdstrike:branch=\"{actor_branch}\"")
 
                     if act.get('last_modified_date'):
-                        ts_check = 0
-                        if os.path.exists(self.actors_timestamp_filename):
-                            with open(self.actors_timestamp_filename, 'r', encoding="utf-8") as ts_file:
-                                ts_check = ts_file.read()
                         # This might be a little over the top
-                        nowstamp = None
                         try:
-                            if int(act.get('last_modified_date')) > int(ts_check):
-                                nowstamp = act.get('last_modified_date')
+                            if int(act.get('last_modified_date')) > self._ts_cache:
+                                nowstamp = int(act.get('last_modified_date'))
                         except ValueError:
                             nowstamp = int(datetime.datetime.today().timestamp())
-                        if nowstamp:
-                            with open(self.actors_timestamp_filename, 'w', encoding="utf-8") as ts_file:
-                                ts_file.write(str(int(nowstamp)+1))
-                    returned = True
                 else:
                     self.log.warning("Failed to create a MISP event for actor %s.", act)
+                    event = None
             else:
                 self.log.debug("Actor %s already exists, skipping", actor_name)
 
-        return returned
+        return event, nowstamp
+
+
+    def _submit_event(self, event: MISPEvent):
+        """Add a prepared adversary event to MISP, retrying transient failures."""
+        success = False
+        max_tries = 3
+        for cur_try in range(max_tries):
+            try:
+                result = self.misp.add_event(event, True)
+                if isinstance(result, dict) and "errors" in result:
+                    # Client side (4xx) errors will not resolve on retry
+                    self.log.warning("MISP rejected event %s.\n%s", event.info, str(result["errors"]))
+                    break
+                success = True
+                break
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, MISPServerError) as err:
+                if cur_try + 1 < max_tries:
+                    # Jittered backoff so workers do not retry against MISP in lockstep
+                    timeout = min(30.0, 0.3 * 2 ** cur_try * (1 + random.random() * 0.5))
+                    self.log.warning("Could not add or tag event %s. Will retry in %.2f seconds.\n%s", event.info, timeout, str(err))
+                    time.sleep(timeout)
+                else:
+                    self.log.warning("Could not add or tag event %s.\n%s", event.info, str(err))
+            except Exception as err:
+                self.log.warning("Could not add or tag event %s.\n%s", event.info, str(err))
+                break
+        if not success:
+            self.log.warning("Unable to add event %s.", event.info)
+
+        return success
+
+
+    def _submit_events(self, events: list):
+        """Submit prepared adversary events to MISP over the shared connection pool."""
+        reported = 0
+        completed = 0
+        with concurrent.futures.ThreadPoolExecutor(self.misp.thread_count, thread_name_prefix="thread") as executor:
+            futures = {
+                executor.submit(self._submit_event, evt) for evt in events
+            }
+            for fut in concurrent.futures.as_completed(futures):
+                completed += 1
+                if fut.result():
+                    reported += 1
+                if not completed % 50:
+                    self.log.info("%i of %i adversary events submitted.", completed, len(events))
+
+        return reported
+
+
+    def _restore_cluster(self, cluster_id):
+        """Restore a soft deleted Threat Actor galaxy cluster."""
+        return self.misp._check_json_response(self.misp._prepare_request("POST", f"galaxy_clusters/restore/{cluster_id}"))
 
 
     def process_actors(self, actors_days_before, events_already_imported):
@@ -147,29 +249,19 @@ class ActorsImporter:
         self.log.info("Start Threat Actor galaxy cluster alignment")
         actors = self.intel_api_client.get_actors(start_get_events, self.import_settings["type"])
         self.log.info("Got %i adversaries from the Crowdstrike Intel API.", len(actors))
-        actor_map = get_actor_galaxy_map(self.misp, self.intel_api_client, self.import_settings["type"])
-        act_id_list = [x.get("id") for x in actors if x["name"] not in actor_map]
-        if act_id_list:
+        # Retrieve the full details for every adversary once, reused for alignment and event creation
+        if actors:
             act_detail = self.intel_api_client.falcon.get_actor_entities(
-                ids=act_id_list,
+                ids=[x.get("id") for x in actors],
                 fields="__full__"
                 )["body"]["resources"]
         else:
             act_detail = []
-        # Set any inbound CS cluster elements
-        for mapped in actor_map.values():
-            cluster = self.misp.get_galaxy_cluster(mapped["uuid"])
-            details = {}
-            for det in [d for d in act_detail if d.get("id") == mapped["cs_id"]]:
-                details = det
-                add_cluster_elements(details, details, cluster)
-
+        details_by_id = {d.get("id"): d for d in act_detail if d.get("id")}
+        actor_map = get_actor_galaxy_map(self.misp, self.intel_api_client, self.import_settings["type"])
         # Create Threat Actor Galaxy Clusters for missing CS adversaries
         for act in [a for a in actors if a["name"] not in actor_map]:
-            details = {}
-            for det in act_detail:
-                if det.get("id") == act.get("id"):
-                    details = det
+            details = details_by_id.get(act.get("id"), {})
             cluster = MISPGalaxyCluster()
             cluster["distribution"] = 1
             cluster["authors"] = ["CrowdStrike"]
@@ -193,18 +285,25 @@ class ActorsImporter:
                 "cs_id": act["id"]
             }
         # Restore any soft deleted CrowdStrike adversary threat actor clusters
-        for act in [a["id"] for a in actor_map.values() if a["deleted"]]:
-            # -ca does a hard delete so this will be skipped.
-            self.misp._check_json_response(self.misp._prepare_request("POST", f"galaxy_clusters/restore/{act}"))
+        # -ca does a hard delete so this will be skipped.
+        with concurrent.futures.ThreadPoolExecutor(self.misp.thread_count, thread_name_prefix="thread") as executor:
+            futures = {
+                executor.submit(self._restore_cluster, act) for act in [a["id"] for a in actor_map.values() if a["deleted"]]
+            }
+            for fut in concurrent.futures.as_completed(futures):
+                fut.result()
 
         self.import_settings["actor_map"] = actor_map
         self.log.info("Threat Actor galaxy alignment complete.")
 
+        # Read the last checkpoint once, workers compare against this in memory
+        self._ts_cache = 0
         if os.path.isfile(self.actors_timestamp_filename):
             with open(self.actors_timestamp_filename, 'r', encoding="utf-8") as ts_file:
                 line = ts_file.readline()
                 if line:
-                    start_get_events = int(line)
+                    self._ts_cache = int(line)
+                    start_get_events = self._ts_cache
         self.log.info(f"Start importing CrowdStrike Adversaries as events into MISP (past {actors_days_before} days).")
         time_send_request = datetime.datetime.now()
 
@@ -213,32 +312,50 @@ class ActorsImporter:
             with open(self.actors_timestamp_filename, 'w', encoding="utf-8") as ts_file:
                 ts_file.write(str(int(time_send_request.timestamp())))
         else:
-            actor_details = self.intel_api_client.falcon.get_actor_entities(ids=[x.get("id") for x in actors], fields="__full__")["body"]["resources"]
-            reported = 0
-            with concurrent.futures.ThreadPoolExecutor(self.misp.thread_count, thread_name_prefix="thread") as executor:
-                futures = {
-                    executor.submit(self.batch_import_actors, ac, actor_details, events_already_imported) for ac in actors
-                }
-                for fut in concurrent.futures.as_completed(futures):
-                    if fut.result():
-                        reported += 1
+            events = []
+            latest_stamp = None
+            # Event construction is CPU bound, so build every event up front, then submit them
+            built = []
+            if "fork" in multiprocessing.get_all_start_methods():
+                # Forked workers inherit the configured logging handlers, spawned workers would not
+                build_workers = min(os.cpu_count() or 1, len(actors), 61)
+                with concurrent.futures.ProcessPoolExecutor(max_workers=build_workers,
+                                                            mp_context=multiprocessing.get_context("fork"),
+                                                            initializer=_init_event_builder,
+                                                            initargs=(self, details_by_id, events_already_imported)
+                                                            ) as executor:
+                    for act, (event_json, stamp) in zip(actors, executor.map(_build_event_in_worker, actors)):
+                        event = None
+                        if event_json:
+                            event = MISPEvent()
+                            event.load(event_json)
+                        built.append((act, event, stamp))
+            else:
+                # No fork start method (Windows), build within this process to keep logging intact
+                for act in actors:
+                    built.append((act, *self.build_event_for_actor(act, details_by_id, events_already_imported)))
+            for act, event, stamp in built:
+                if event:
+                    events.append(event)
+                    # Workers only hold a copy of the map, record the adversary here
+                    events_already_imported[act.get("name")] = True
+                if stamp:
+                    latest_stamp = max(latest_stamp or 0, stamp)
+            reported = self._submit_events(events)
+            # Persist the newest modification timestamp once all workers have finished
+            if latest_stamp:
+                self._ts_cache = latest_stamp + 1
+                with open(self.actors_timestamp_filename, 'w', encoding="utf-8") as ts_file:
+                    ts_file.write(str(self._ts_cache))
             self.log.info("Completed import of %i CrowdStrike adversaries into MISP.", reported)
 
         self.log.info("Finished importing CrowdStrike Adversaries as events into MISP.")
 
 
     @staticmethod
-    def int_ref_handler(evt, kc_name, kc_detail, kcatt: MISPObject = None, galaxy_tag: str = None):
+    def int_ref_handler(evt_tags: list, kc_name, kc_detail, kcatt: MISPObject = None, galaxy_tag: str = None):
         sum_id = None
-        goal_cat = "External analysis"
-        if kc_name.title() == "Installation":
-            goal_cat = "Payload installation"
-        if kc_name.title() in ["Weaponization", "Delivery"]:
-            goal_cat = "Payload delivery"
-        if kc_name.title() in ["Objectives", "Reconnaissance"]:
-            goal_cat = "External analysis"
-        if kc_name.lower() == "command and control":
-            goal_cat = "Network activity"
+        goal_cat = _KC_GOAL_CATEGORY.get(normalize_killchain(kc_name).lower(), "External analysis")
         if not isinstance(kc_detail, list):
             kc_detail = kc_detail.replace("\t", "").replace("&nbsp;", "")
         if kc_detail not in ["Unknown", "N/A"]:
@@ -248,11 +365,16 @@ class ActorsImporter:
             sum_id.add_tag(f"kill-chain:{kc_name}")
             if galaxy_tag:
                 sum_id.add_tag(galaxy_tag)
-            evt.add_tag(f"kill-chain:{kc_name}")
+            evt_tags.append(f"kill-chain:{kc_name}")
 
 
-    def create_event_from_actor(self, actor, act_details) -> MISPEvent():
+    def create_event_from_actor(self, actor, act_details: dict, parsed_name: tuple = None) -> MISPEvent():
         """Create a MISP event for a valid Actor."""
+        # Bail out before building anything for an unnamed adversary
+        actor_name = actor.get("name", None)
+        if not actor_name:
+            self.log.warning("Adversary %s missing field name.", actor.get('id'))
+            return None
 
         event = MISPEvent()
         event.analysis = 2
@@ -263,272 +385,277 @@ class ActorsImporter:
             event.date = actor.get("first_activity_date")
         elif actor.get('last_activity_date'):
             event.date = actor.get("last_activity_date")
-        details = {}
-        for det in act_details:
-            if det.get("id") == actor.get("id"):
-                details = det
-        # Actor name, slug and branch
-        actor_name = actor.get("name", None)
-        actor_proper_name = " ".join([n.title() for n in actor.get("name", "").split(" ")])
+        details = act_details.get(actor.get("id"), {})
+        # Event level tags are staged here and applied to the event in one pass
+        event_tags = []
+        actor_proper_name = actor_name.title()
         slug = details.get("slug", actor_name.lower().replace(" ", "-"))
-        actor_branch = actor_name.split(" ")[1].upper()
+        actor_branch, actor_region = parsed_name or _parse_actor_name(actor_name)
 
-        actor_region = ""
         verbosity = self.import_settings["verbose_tags"]
-        if actor_name:
-            for act_reg in [adv for adv in dir(Adversary) if "__" not in adv]:
-                if act_reg in actor_branch:
-                    actor_region = f" ({Adversary[act_reg].value})"
-            event.info = f"ADV-{actor.get('id')} {actor_name}{actor_region}"
-            actor_att = {
-                "type": "threat-actor",
-                "value": actor_proper_name,
-            }
-            # Timestamps
-            had_timestamp = False
-            timestamp_object = MISPObject('timestamp')
-            actor_att["first_seen"] = actor.get("first_activity_date", 0)
-            if not actor_att["first_seen"]:
-                self.log.warning("Adversary %s missing field first_activity_date.", actor_name)
-            actor_att["last_seen"] = actor.get("last_activity_date", 0)
-            if not actor_att["last_seen"]:
-                self.log.warning("Adversary %s missing field last_activity_date.", actor_name)
-            if actor_att.get("last_seen", 0) < actor_att.get("first_seen", 0):
-                # Seems counter-intuitive
-                actor_att["first_seen"] = actor.get("last_activity_date")
-                actor_att["last_seen"] = actor.get("first_activity_date")
-            if actor_att["first_seen"] == 0:
-                actor_att["first_seen"] = actor_att["last_seen"]
-            if actor_att["first_seen"]:
-                timestamp_object.add_attribute('first-seen', datetime.datetime.utcfromtimestamp(actor_att["first_seen"]).isoformat())
-                had_timestamp = True
-
-            if actor_att["last_seen"]:
-                timestamp_object.add_attribute('last-seen', datetime.datetime.utcfromtimestamp(actor_att["last_seen"]).isoformat())
-                had_timestamp = True
-
-            ta = event.add_attribute(**actor_att, disable_correlation=True)
-            ta.add_tag(self.adversary_galaxy_tag(actor_name))
-            actor_split = actor_name.split(" ")
-            actor_branch = actor_split[1] if len(actor_split) > 1 else actor_split[0]
-            event.add_attribute_tag(f"crowdstrike:branch=\"{actor_branch}\"", ta.uuid)
-            if had_timestamp:
-                event.add_object(timestamp_object)
-
-            # Create the organization object for this actor
-            known_as_object = MISPObject('organization')
-            kao_name = known_as_object.add_attribute("name",
-                                                     actor_proper_name,
-                                                     disable_correlation=True,
-                                                     category="Attribution",
-                                                     first_seen=datetime.datetime.utcfromtimestamp(actor_att["first_seen"]).isoformat(),
-                                                     last_seen=datetime.datetime.utcfromtimestamp(actor_att["last_seen"]).isoformat()
-                                                     )
-            kao_ts = known_as_object.add_attribute("date-of-inception",
-                                                   datetime.datetime.utcfromtimestamp(actor_att["first_seen"]).isoformat(),
-                                                   disable_correlation=True,
-                                                   category="External analysis"
-                                                   )
-            kao_name.add_tag(self.adversary_galaxy_tag(actor_name))
-            kao_ts.add_tag(self.adversary_galaxy_tag(actor_name))
-            # All actor reports are of the adversary report type
-            event.add_tag("crowdstrike:report-type=\"Adversary Report\"")
-            # All actor reports are considered Threat Actor Updates
-            event.add_tag("threatmatch:alert-type=\"Threat Actor Updates\"")
-            # All adversary events are considered "complete" from a workflow perspective.
-            if confirm_boolean_param(self.settings["TAGGING"].get("taxonomic_WORKFLOW", False)):
-                event.add_tag("workflow:state=\"complete\"")
-
-            if actor_name.upper() in self.import_settings["actor_map"]:
-                event.add_tag(self.adversary_galaxy_tag(actor_name))
-            else:
-                event.add_tag(f"CrowdStrike:adversary: {actor_name}")
-
-            if details.get('url'):
-                event.add_attribute('link', details.get('url'), disable_correlation=True)
-
-            # Adversary description
-            reg_desc = details.get("description", None)
-            if reg_desc:
-                kao_desc = known_as_object.add_attribute("description", reg_desc, disable_correlation=True, category="External analysis")
-                kao_desc.add_tag(self.adversary_galaxy_tag(actor_name))
-                # Report Annotation and full text
-                rich_desc = details.get("rich_text_description", None)
-                long_desc = details.get("long_description", None)
-                if long_desc or rich_desc:
-                    # Moving over to just using the event report for the MD formatted content
-                    md_version = markdownify(rich_desc)
-                    if not md_version:
-                        md_version = long_desc
-                    if not md_version:
-                        md_version = reg_desc
-
-                event.add_event_report(event.info, md_version.replace("\t", "").replace("      ", ""))
-
-            # Adversary type
-            act_type = details.get("actor_type", None)
-            if act_type:
-                event.add_tag(f"crowdstrike:type=\"{act_type.upper()}\"")
-
-            # Adversary motives
-            motive_list = []
-            motives = details.get("motivations", None)
-            if motives:
-                motive_list = [m.get("value") for m in motives]
-                to_set = []
-                for mname in motive_list:
-                    if mname.upper() == "STATE-SPONSORED":
-                        if "state-responsibility:state-prohibited-but-inadequate." in to_set:
-                            to_set.pop(to_set.index("state-responsibility:state-prohibited-but-inadequate."))
-                        to_set.append("state-responsibility:state-coordinated")
-                    elif mname.upper() in ["CRIMINAL", "HACKTIVISM"]:
-                        if not "state-responsibility:state-coordinated" in to_set:
-                            to_set.append("state-responsibility:state-prohibited-but-inadequate.")
-                        if mname.upper() == "HACKTIVISM":
-                            event.add_tag("threatmatch:incident-type=\"Hacktivism Activity\"")
-                    else:
-                        event.add_tag(f"CrowdStrike:adversary:motivation: {mname.upper()}")
-                for lab in to_set:
-                    event.add_tag(lab)
+        region_label = f" ({actor_region})" if actor_region else ""
+        event.info = f"ADV-{actor.get('id')} {actor_name}{region_label}"
+        actor_att = {
+            "type": "threat-actor",
+            "value": actor_proper_name,
+        }
+        # Timestamps
+        had_timestamp = False
+        timestamp_object = MISPObject('timestamp')
+        actor_att["first_seen"] = actor.get("first_activity_date", 0)
+        if not actor_att["first_seen"]:
+            self.log.warning("Adversary %s missing field first_activity_date.", actor_name)
+        actor_att["last_seen"] = actor.get("last_activity_date", 0)
+        if not actor_att["last_seen"]:
+            self.log.warning("Adversary %s missing field last_activity_date.", actor_name)
+        if actor_att.get("last_seen", 0) < actor_att.get("first_seen", 0):
+            # Seems counter-intuitive
+            actor_att["first_seen"] = actor.get("last_activity_date")
+            actor_att["last_seen"] = actor.get("first_activity_date")
+        if actor_att["first_seen"] == 0:
+            actor_att["first_seen"] = actor_att["last_seen"]
+        first_seen = datetime.datetime.utcfromtimestamp(actor_att["first_seen"]).isoformat()
+        last_seen = datetime.datetime.utcfromtimestamp(actor_att["last_seen"]).isoformat()
+        if actor_att["first_seen"]:
+            timestamp_object.add_attribute('first-seen', first_seen)
+            had_timestamp = True
+
+        if actor_att["last_seen"]:
+            timestamp_object.add_attribute('last-seen', last_seen)
+            had_timestamp = True
+
+        galaxy_tag = self.adversary_galaxy_tag(actor_name)
+        ta = event.add_attribute(**actor_att, disable_correlation=True)
+        ta.add_tag(galaxy_tag)
+        ta.add_tag(f"crowdstrike:branch=\"{actor_branch}\"")
+        if had_timestamp:
+            event.add_object(timestamp_object)
+
+        # Create the organization object for this actor
+        known_as_object = MISPObject('organization')
+        kao_name = known_as_object.add_attribute("name",
+                                                 actor_proper_name,
+                                                 disable_correlation=True,
+                                                 category="Attribution",
+                                                 first_seen=first_seen,
+                                                 last_seen=last_seen
+                                                 )
+        kao_ts = known_as_object.add_attribute("date-of-inception",
+                                               first_seen,
+                                               disable_correlation=True,
+                                               category="External analysis"
+                                               )
+        kao_name.add_tag(galaxy_tag)
+        kao_ts.add_tag(galaxy_tag)
+        # All actor reports are of the adversary report type
+        event_tags.append("crowdstrike:report-type=\"Adversary Report\"")
+        # All actor reports are considered Threat Actor Updates
+        event_tags.append("threatmatch:alert-type=\"Threat Actor Updates\"")
+        # All adversary events are considered "complete" from a workflow perspective.
+        if self._tax["taxonomic_WORKFLOW"]:
+            event_tags.append("workflow:state=\"complete\"")
+
+        if actor_name.upper() in self.import_settings["actor_map"]:
+            event_tags.append(galaxy_tag)
+        else:
+            event_tags.append(f"CrowdStrike:adversary: {actor_name}")
+
+        if details.get('url'):
+            event.add_attribute('link', details.get('url'), disable_correlation=True)
+
+        # Adversary description
+        reg_desc = details.get("description", None)
+        if reg_desc:
+            kao_desc = known_as_object.add_attribute("description", reg_desc, disable_correlation=True, category="External analysis")
+            kao_desc.add_tag(galaxy_tag)
+            # Report Annotation and full text
+            rich_desc = details.get("rich_text_description", None)
+            long_desc = details.get("long_description", None)
+            if long_desc or rich_desc:
+                # Moving over to just using the event report for the MD formatted content
+                md_version = markdownify(rich_desc)
+                if not md_version:
+                    md_version = long_desc
+                if not md_version:
+                    md_version = reg_desc
+
+            event.add_event_report(event.info, md_version.replace("\t", "").replace("      ", ""))
+
+        # Adversary type
+        act_type = details.get("actor_type", None)
+        if act_type:
+            event_tags.append(f"crowdstrike:type=\"{act_type.upper()}\"")
+
+        # Adversary motives
+        motive_list = []
+        motives = details.get("motivations", None)
+        if motives:
+            motive_list = [m.get("value") for m in motives]
+            to_set = []
+            for mname in motive_list:
+                mname = mname.upper()
+                if mname == "STATE-SPONSORED":
+                    if "state-responsibility:state-prohibited-but-inadequate." in to_set:
+                        to_set.pop(to_set.index("state-responsibility:state-prohibited-but-inadequate."))
+                    to_set.append("state-responsibility:state-coordinated")
+                elif mname in ["CRIMINAL", "HACKTIVISM"]:
+                    if not "state-responsibility:state-coordinated" in to_set:
+                        to_set.append("state-responsibility:state-prohibited-but-inadequate.")
+                    if mname == "HACKTIVISM":
+                        event_tags.append("threatmatch:incident-type=\"Hacktivism Activity\"")
+                else:
+                    event_tags.append(f"CrowdStrike:adversary:motivation: {mname}")
+            for lab in to_set:
+                event_tags.append(lab)
+        if motive_list:
+            for mot in motive_list:
+                if mot.upper() in ["STATE-SPONSORED", "HACKTIVISM", "CRIMINAL"]:
+                    known_as_object.add_attribute("type-of-organization", mot, disable_correlation=True, category="External analysis")
+
+        # Adversary capability
+        cap_val = None
+        cap = details.get("capability", None)
+        if cap:
+            cap_val = cap.get("value")
+            if cap_val:
+                cap_upper = cap_val.upper()
+                event_tags.append(f"crowdstrike:capability=\"{cap_upper}\"")
+                # Set adversary event threat level based upon adversary capability
+                if "BELOW" in cap_upper or "LOW" in cap_upper:
+                    event.threat_level_id = 3
+                elif "ABOVE" in cap_upper or "HIGH" in cap_upper:
+                    event.threat_level_id = 1
+                else:
+                    event.threat_level_id = 2
+        # Adversary threatmatch capabilities
+        for caps in [c["value"].upper() for c in details.get("capabilities", [])]:
+            threat = normalize_threatmatch(caps)
+            if caps != threat:
+                for match in threat.split(","):
+                    event_tags.append(f"threatmatch:{match}")
+        for objectives in [c["value"].upper() for c in details.get("objectives", [])]:
+            threat = normalize_threatmatch(objectives)
+            if objectives != threat:
+                for match in threat.split(","):
+                    event_tags.append(f"threatmatch:{match}")
+        # Kill chain elements
+        kill_chain_detail = details.get("kill_chain")
+        if kill_chain_detail:
+            kc_att = MISPObject("intrusion-set")
+            objectives = kill_chain_detail.get("actions_and_objectives", None)
+            candc = kill_chain_detail.get("command_and_control", None)
+            delivery = kill_chain_detail.get("delivery", None)
+            exploitation = kill_chain_detail.get("exploitation", None)
+            installation = kill_chain_detail.get("installation", None)
+            reconnaissance = kill_chain_detail.get("reconnaissance", None)
+            weaponization = kill_chain_detail.get("weaponization", None)
+            adv_objectives = [o["value"] for o in details.get("objectives", [])]
+
+            # Kill chain - Objectives
+            if objectives:
+                self.int_ref_handler(event_tags, "actions on objectives", objectives, kc_att, galaxy_tag)
+
+            # Kill chain - Command and Control
+            if candc:
+                self.int_ref_handler(event_tags, "command and control", candc, kc_att, galaxy_tag)
+
+            # Kill chain - Delivery
+            if delivery:
+                self.int_ref_handler(event_tags, "delivery", delivery, kc_att, galaxy_tag)
+
+            # Kill chain - Exploitation
+            if exploitation:
+                if exploitation.replace("\t", "".replace("&nbsp;", "")) not in ["Unknown", "N/A"]:
+                    #exploits = exploitation.replace("\t", "").replace("&nbsp;", "").split("\r\n")
+                    for exploits in exploitation.replace("\t", "").replace("&nbsp;", "").split("\r\n"):
+                        for exploit in exploits.split(","):
+                            ex_id = event.add_attribute("vulnerability", exploit.upper(), category="External analysis")
+                            if verbosity:
+                                ex_id.add_tag("kill-chain:Exploitation")
+                                event_tags.append("kill-chain:Exploitation")
+            # Kill chain - Installation
+            if installation:
+                self.int_ref_handler(event_tags, "installation", installation, kc_att, galaxy_tag)
+                
+            # Kill chain - Reconnaissance
+            if reconnaissance:
+                self.int_ref_handler(event_tags, "reconnaissance", reconnaissance, kc_att, galaxy_tag)
+            # Kill chain - Weaponization
+            if weaponization:
+                self.int_ref_handler(event_tags, "weaponization", weaponization, kc_att, galaxy_tag)
+
+            if cap_val:
+                kc_att.add_attribute("resource_level", cap_val, disable_correlation=True, category="External analysis")
             if motive_list:
+                motlist = []
                 for mot in motive_list:
                     if mot.upper() in ["STATE-SPONSORED", "HACKTIVISM", "CRIMINAL"]:
-                        known_as_object.add_attribute("type-of-organization", mot, disable_correlation=True, category="External analysis")
-
-            # Adversary capability
-            cap_val = None
-            cap = details.get("capability", None)
-            if cap:
-                cap_val = cap.get("value")
-                if cap_val:
-                    event.add_tag(f"crowdstrike:capability=\"{cap_val.upper()}\"")
-                    # Set adversary event threat level based upon adversary capability
-                    if "BELOW" in cap_val.upper() or "LOW" in cap_val.upper():
-                        event.threat_level_id = 3
-                    elif "ABOVE" in cap_val.upper() or "HIGH" in cap_val.upper():
-                        event.threat_level_id = 1
-                    else:
-                        event.threat_level_id = 2
-            # Adversary threatmatch capabilities
-            for caps in [c["value"] for c in details.get("capabilities", [])]:
-                if caps.upper() != normalize_threatmatch(caps.upper()):
-                    for match in normalize_threatmatch(caps.upper()).split(","):
-                        event.add_tag(f"threatmatch:{match}")
-            for objectives in [c["value"] for c in details.get("objectives", [])]:
-                if objectives.upper() != normalize_threatmatch(objectives.upper()):
-                    for match in normalize_threatmatch(objectives.upper()).split(","):
-                        event.add_tag(f"threatmatch:{match}")
-            # Kill chain elements
-            kill_chain_detail = details.get("kill_chain")
-            if kill_chain_detail:
-                kc_att = MISPObject("intrusion-set")
-                objectives = kill_chain_detail.get("actions_and_objectives", None)
-                candc = kill_chain_detail.get("command_and_control", None)
-                delivery = kill_chain_detail.get("delivery", None)
-                exploitation = kill_chain_detail.get("exploitation", None)
-                installation = kill_chain_detail.get("installation", None)
-                reconnaissance = kill_chain_detail.get("reconnaissance", None)
-                weaponization = kill_chain_detail.get("weaponization", None)
-                adv_objectives = [o["value"] for o in details.get("objectives", [])]
-
-                # Kill chain - Objectives
-                if objectives:
-                    self.int_ref_handler(event, "actions on objectives", objectives, kc_att, self.adversary_galaxy_tag(actor_name))
-
-                # Kill chain - Command and Control
-                if candc:
-                    self.int_ref_handler(event, "command and control", candc, kc_att, self.adversary_galaxy_tag(actor_name))
-
-                # Kill chain - Delivery
-                if delivery:
-                    self.int_ref_handler(event, "delivery", delivery, kc_att, self.adversary_galaxy_tag(actor_name))
-
-                # Kill chain - Exploitation
-                if exploitation:
-                    if exploitation.replace("\t", "".replace("&nbsp;", "")) not in ["Unknown", "N/A"]:
-                        #exploits = exploitation.replace("\t", "").replace("&nbsp;", "").split("\r\n")
-                        for exploits in exploitation.replace("\t", "").replace("&nbsp;", "").split("\r\n"):
-                            for exploit in exploits.split(","):
-                                ex_id = event.add_attribute("vulnerability", exploit.upper(), category="External analysis")
-                                if verbosity:
-                                    event.add_attribute_tag("kill-chain:Exploitation", ex_id.uuid)
-                                    event.add_tag("kill-chain:Exploitation")
-                # Kill chain - Installation
-                if installation:
-                    self.int_ref_handler(event, "installation", installation, kc_att, self.adversary_galaxy_tag(actor_name))
-                    
-                # Kill chain - Reconnaissance
-                if reconnaissance:
-                    self.int_ref_handler(event, "reconnaissance", reconnaissance, kc_att, self.adversary_galaxy_tag(actor_name))
-                # Kill chain - Weaponization
-                if weaponization:
-                    self.int_ref_handler(event, "weaponization", weaponization, kc_att, self.adversary_galaxy_tag(actor_name))
-
-                if cap_val:
-                    kc_att.add_attribute("resource_level", cap_val, disable_correlation=True, category="External analysis")
-                if motive_list:
-                    motlist = []
-                    for mot in motive_list:
-                        if mot.upper() in ["STATE-SPONSORED", "HACKTIVISM", "CRIMINAL"]:
-                            primary = mot.title().replace("Sponsored", "sponsored")
-                            if act_type:
-                                primary = f"{primary} ({act_type.title()})"
-                            motlist.append(primary)
-                    for mot in motlist:
-                        res = kc_att.add_attribute("primary-motivation", mot, disable_correlation=True, category="External analysis")
-                        res.add_tag(self.adversary_galaxy_tag(actor_name))
-                if adv_objectives:
-                    objs_list = []
-                    for objs in adv_objectives:
-                        if objs.upper() in [a.name for a in AdversaryMotivation]:
-                            objs_list.append(AdversaryMotivation[objs.upper()].value)
-                    if objs_list:
-                        for objective in objs_list:
-                            res = kc_att.add_attribute("secondary-motivation", objective, disable_correlation=True, category="External analysis")
-                            res.add_tag(self.adversary_galaxy_tag(actor_name))
-                event.add_object(kc_att)
-
-            if actor.get('known_as') or actor.get("origins"):
-                if actor.get("known_as"):
-                    aliased = [a.strip() for a in actor.get("known_as").split(",")]
-                    for alias in [a for a in aliased if a]:
-                        kao = known_as_object.add_attribute('alias', alias, disable_correlation=True, category="Attribution")
-                        # Tag the aliases to the threat-actor attribution
-                        if verbosity and kao:
-                            kao.add_tag(f"crowdstrike:branch=\"{actor_branch}\"")
-                            kao.add_tag(self.adversary_galaxy_tag(actor_name))
-            
-                for orig in actor.get("origins", []):
-                    locale = orig.get("value")
-                    if locale:
-                        kar = event.add_attribute("country-of-residence", locale, disable_correlation=True)
-                        event.add_tag(f"crowdstrike:origin=\"{locale.upper()}\"")
-                        if verbosity:
-                            event.add_attribute_tag(f"crowdstrike:origin=\"{locale.upper()}\"", kar.uuid)
-            if known_as_object:
-                event.add_object(known_as_object)
-
-            # Adversary victim location
-            if actor.get("target_countries"):
-                region_list = [c.get('value') for c in actor.get('target_countries', [])]
-                for region in region_list:
-                    region = normalize_locale(region)
-                    if region in self.regions:
-                        self.log.debug("Regional match. Tagging %s", self.regions[region])
-                        event.add_tag(self.regions[region])
-                    else:
-                        self.log.debug("Country match. Tagging %s.", region)
-                        event.add_tag(f"misp-galaxy:target-information=\"{region}\"")
-
-            # Adversary victim industry
-            if actor.get("target_industries"):
-                sector_list = [s.get('value') for s in actor.get('target_industries', [])]
-                for sector in sector_list:
-                    event.add_tag(f"misp-galaxy:sector=\"{normalize_sector(sector)}\"")
-            # TYPE Taxonomic tag, all events
-            event = taxonomic_event_tagging(event, self.settings["TAGGING"])
-
-        else:
-            self.log.warning("Adversary %s missing field name.", actor.get('id'))
+                        primary = mot.title().replace("Sponsored", "sponsored")
+                        if act_type:
+                            primary = f"{primary} ({act_type.title()})"
+                        motlist.append(primary)
+                for mot in motlist:
+                    res = kc_att.add_attribute("primary-motivation", mot, disable_correlation=True, category="External analysis")
+                    res.add_tag(galaxy_tag)
+            if adv_objectives:
+                objs_list = []
+                for objs in adv_objectives:
+                    objs = objs.upper()
+                    if objs in AdversaryMotivation.__members__:
+                        objs_list.append(AdversaryMotivation[objs].value)
+                if objs_list:
+                    for objective in objs_list:
+                        res = kc_att.add_attribute("secondary-motivation", objective, disable_correlation=True, category="External analysis")
+                        res.add_tag(galaxy_tag)
+            event.add_object(kc_att)
+
+        if actor.get('known_as') or actor.get("origins"):
+            if actor.get("known_as"):
+                aliased = [a.strip() for a in actor.get("known_as").split(",")]
+                for alias in [a for a in aliased if a]:
+                    kao = known_as_object.add_attribute('alias', alias, disable_correlation=True, category="Attribution")
+                    # Tag the aliases to the threat-actor attribution
+                    if verbosity and kao:
+                        kao.add_tag(f"crowdstrike:branch=\"{actor_branch}\"")
+                        kao.add_tag(galaxy_tag)
+        
+            for orig in actor.get("origins", []):
+                locale = orig.get("value")
+                if locale:
+                    kar = event.add_attribute("country-of-residence", locale, disable_correlation=True)
+                    origin_tag = f"crowdstrike:origin=\"{locale.upper()}\""
+                    event_tags.append(origin_tag)
+                    if verbosity:
+                        kar.add_tag(origin_tag)
+        if known_as_object:
+            event.add_object(known_as_object)
+
+        # Adversary victim location
+        if actor.get("target_countries"):
+            # Normalize once and drop repeated regions before tagging
+            region_list = dict.fromkeys(normalize_locale(c.get('value')) for c in actor.get('target_countries', []))
+            for region in region_list:
+                region_tag = self.regions.get(region)
+                if region_tag:
+                    self.log.debug("Regional match. Tagging %s", region_tag)
+                    event_tags.append(region_tag)
+                else:
+                    self.log.debug("Country match. Tagging %s.", region)
+                    event_tags.append(f"misp-galaxy:target-information=\"{region}\"")
+
+        # Adversary victim industry
+        if actor.get("target_industries"):
+            sector_list = [s.get('value') for s in actor.get('target_industries', [])]
+            for sector in sector_list:
+                event_tags.append(f"misp-galaxy:sector=\"{normalize_sector(sector)}\"")
+        # Apply the staged event tags, dropping any duplicates
+        staged = []
+        for tag_name in dict.fromkeys(event_tags):
+            misp_tag = MISPTag()
+            misp_tag.from_dict(name=tag_name)
+            staged.append(misp_tag)
+        event.tags = staged
+        # TYPE Taxonomic tag, all events
+        event = taxonomic_event_tagging(event, self._tax)
 
         return event
@@ -1,4 +1,5 @@
 """Helper methods."""
+from functools import lru_cache
 from logging import Logger
 from datetime import datetime, timedelta
 from ._version import __version__ as MISP_IMPORT_VERSION
@@ -299,6 +300,7 @@ def normalize_locale(locale_to_normalize: str):
     return locale_to_normalize
 
 
+@lru_cache(maxsize=64)
 def normalize_killchain(kc_to_normalize: str):
     normalize = {
         "actions_and_objectives": "objectives",
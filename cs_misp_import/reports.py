@@ -294,6 +294,7 @@ class ReportsImporter:
                         details.extend(fut.result())
 
             self.log.info(f"Retrieved extended report details for {len(details)} reports.")
+            details = {d.get("id"): d for d in details if d.get("id")}
 
             # Batched retrieval of related indicator details
             indicator_list = []
@@ -560,7 +561,7 @@ class ReportsImporter:
 
         return event
 
-    def create_event_from_report(self, report, report_details, indicator_list) -> MISPEvent:
+    def create_event_from_report(self, report, report_details: dict, indicator_list) -> MISPEvent:
         """Create a MISP event from a Intel report."""
         if report.get('name'):
             event = MISPEvent()
@@ -569,10 +570,7 @@ class ReportsImporter:
             if self.import_settings["publish"]:
                 event.published = True
             # Extended report details lookup
-            details = {}
-            for det in report_details:
-                if det.get("id") == report.get("id"):
-                    details = det
+            details = report_details.get(report.get("id"), {})
             report_name = report.get('name')
             # Report / Event name
             event.info = report_name
@@ -29,7 +29,13 @@ class MISP(ExpandedPyMISP):
         kwargs.pop("max_threads")
         kwargs.pop("cs_org_id")
         super().__init__(*args, **kwargs)
-        self._PyMISP__session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=int(self.thread_count), pool_maxsize=int(self.thread_count)*2))
+        # Share one blocking keep-alive pool across all worker threads so connections are reused
+        pooled_adapter = requests.adapters.HTTPAdapter(pool_connections=int(self.thread_count),
+                                                       pool_maxsize=int(self.thread_count)*2,
+                                                       pool_block=True
+                                                       )
+        self._PyMISP__session.mount('https://', pooled_adapter)
+        self._PyMISP__session.mount('http://', pooled_adapter)
         self.deleted_attribute_count = 0        
         self.deleted_event_count = 0
         self.deleted_tag_count = 0